@@ -10,6 +10,9 @@ class Config:
     # Trading Parameters
     DEFAULT_LEVERAGE = 10
     
+    # Return typed records (src/models.py) instead of raw response dicts
+    TYPED_RECORDS = False
+    
     # Logging
     LOG_FILE = 'trading_bot.log'
     LOG_LEVEL = 'INFO'
\ No newline at end of file
@@ -30,6 +30,7 @@ def print_menu():
     [8] View Positions
     [9] Set Leverage
     [10] Get Current Price
+    [11] Modify Limit Order
     [0] Exit
     
     ═════════════════════════════════════════════════
@@ -37,14 +38,17 @@ def print_menu():
     print(menu)
 
 
-def get_user_input(prompt: str, input_type=str):
-    """Get and validate user input"""
+def get_user_input(prompt: str, input_type=str, default=None):
+    """Get and validate user input (empty input returns default, if given)"""
     while True:
         try:
             value = input(prompt)
             if value.strip().lower() == 'q':
                 return None
             
+            if default is not None and not value.strip():
+                return default
+            
             converted_value = input_type(value)
             return converted_value
             
@@ -62,7 +66,7 @@ def main():
     try:
         # Initialize bot (uses credentials from config.py)
         print("\n🔄 Initializing bot...")
-        bot = TradingBot()
+        bot = TradingBot(typed=True)
         print("✅ Bot initialized successfully!\n")
         
         while True:
@@ -83,9 +87,9 @@ def main():
                     if None not in [symbol, side, quantity]:
                         order = bot.place_market_order(symbol, side, quantity)
                         print(f"\n✅ Order placed successfully!")
-                        print(f"Order ID: {order['orderId']}")
-                        print(f"Status: {order['status']}")
-                        print(f"Executed Quantity: {order['executedQty']}")
+                        print(f"Order ID: {order.order_id}")
+                        print(f"Status: {order.status}")
+                        print(f"Executed Quantity: {order.executed_qty}")
                 
                 elif choice == 2:  # Limit Order
                     print("\n📊 LIMIT ORDER")
@@ -97,9 +101,9 @@ def main():
                     if None not in [symbol, side, quantity, price]:
                         order = bot.place_limit_order(symbol, side, quantity, price)
                         print(f"\n✅ Order placed successfully!")
-                        print(f"Order ID: {order['orderId']}")
-                        print(f"Status: {order['status']}")
-                        print(f"Price: {order['price']}")
+                        print(f"Order ID: {order.order_id}")
+                        print(f"Status: {order.status}")
+                        print(f"Price: {order.price}")
                 
                 elif choice == 3:  # Stop-Limit Order
                     print("\n📊 STOP-LIMIT ORDER")
@@ -114,8 +118,8 @@ def main():
                             symbol, side, quantity, stop_price, limit_price
                         )
                         print(f"\n✅ Order placed successfully!")
-                        print(f"Order ID: {order['orderId']}")
-                        print(f"Status: {order['status']}")
+                        print(f"Order ID: {order.order_id}")
+                        print(f"Status: {order.status}")
                         print(f"Stop Price: {stop_price}")
                         print(f"Limit Price: {limit_price}")
                 
@@ -132,13 +136,13 @@ def main():
                     if orders:
                         print(f"\nFound {len(orders)} open order(s):\n")
                         for order in orders:
-                            print(f"Order ID: {order['orderId']}")
-                            print(f"Symbol: {order['symbol']}")
-                            print(f"Side: {order['side']}")
-                            print(f"Type: {order['type']}")
-                            print(f"Price: {order['price']}")
-                            print(f"Quantity: {order['origQty']}")
-                            print(f"Status: {order['status']}")
+                            print(f"Order ID: {order.order_id}")
+                            print(f"Symbol: {order.symbol}")
+                            print(f"Side: {order.side}")
+                            print(f"Type: {order.type}")
+                            print(f"Price: {order.price}")
+                            print(f"Quantity: {order.orig_qty}")
+                            print(f"Status: {order.status}")
                             print("-" * 50)
                     else:
                         print("\nNo open orders found")
@@ -159,13 +163,13 @@ def main():
                     
                     if None not in [symbol, order_id]:
                         order = bot.get_order_status(symbol, order_id)
-                        print(f"\nOrder ID: {order['orderId']}")
-                        print(f"Symbol: {order['symbol']}")
-                        print(f"Status: {order['status']}")
-                        print(f"Type: {order['type']}")
-                        print(f"Side: {order['side']}")
-                        print(f"Price: {order['price']}")
-                        print(f"Executed Qty: {order['executedQty']}/{order['origQty']}")
+                        print(f"\nOrder ID: {order.order_id}")
+                        print(f"Symbol: {order.symbol}")
+                        print(f"Status: {order.status}")
+                        print(f"Type: {order.type}")
+                        print(f"Side: {order.side}")
+                        print(f"Price: {order.price}")
+                        print(f"Executed Qty: {order.executed_qty}/{order.orig_qty}")
                 
                 elif choice == 7:  # View Balance
                     print("\n💰 ACCOUNT BALANCE")
@@ -173,9 +177,8 @@ def main():
                     
                     print("\nAsset Balances:")
                     for asset in balance:
-                        bal = float(asset['balance'])
-                        if bal > 0:
-                            print(f"{asset['asset']}: {bal}")
+                        if asset.balance is not None and asset.balance > 0:
+                            print(f"{asset.asset}: {asset.balance}")
                 
                 elif choice == 8:  # View Positions
                     print("\n📍 OPEN POSITIONS")
@@ -183,14 +186,13 @@ def main():
                     
                     found_positions = False
                     for pos in positions:
-                        if float(pos['positionAmt']) != 0:
+                        if pos.is_open:
                             found_positions = True
-                            print(f"\nSymbol: {pos['symbol']}")
-                            print(f"Position Amount: {pos['positionAmt']}")
-                            print(f"Entry Price: ${pos['entryPrice']}")
-                            print(f"Mark Price: ${pos['markPrice']}")
-                            print(f"Unrealized PnL: ${pos['unrealizedProfit']}")
-                            print(f"Leverage: {pos['leverage']}x")
+                            print(f"\nSymbol: {pos.symbol}")
+                            print(f"Position Amount: {pos.position_amt}")
+                            print(f"Entry Price: ${pos.entry_price}")
+                            print(f"Mark Price: ${pos.mark_price}")
+                            print(f"Unrealized PnL: ${pos.unrealized_profit}")
                             print("-" * 50)
                     
                     if not found_positions:
@@ -216,6 +218,22 @@ def main():
                         price = bot.get_current_price(symbol)
                         print(f"\n{symbol}: ${price:,.2f}")
                 
+                elif choice == 11:  # Modify Order
+                    print("\n✏️  MODIFY LIMIT ORDER")
+                    symbol = get_user_input("Symbol: ").upper()
+                    order_id = get_user_input("Order ID: ", int)
+                    price = get_user_input("New Limit Price: ", float)
+                    quantity = get_user_input("New Quantity (press Enter to keep): ",
+                                              float, default='')
+                    
+                    if None not in [symbol, order_id, price, quantity]:
+                        quantity = quantity if quantity != '' else None
+                        order = bot.modify_order(symbol, order_id, price, quantity)
+                        print(f"\n✅ Order modified successfully!")
+                        print(f"Order ID: {order.order_id}")
+                        print(f"Price: {order.price}")
+                        print(f"Quantity: {order.orig_qty}")
+                
                 else:
                     print("\n❌ Invalid option. Please try again.")
             
@@ -1,8 +1,9 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from config import Config
 from src.orders import OrderManager
+from src.models import Order, Position, Balance
 from logs.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,8 +12,14 @@ logger = setup_logger(__name__)
 class TradingBot:
     """Main trading bot class"""
     
-    def __init__(self):
-        """Initialize the trading bot"""
+    def __init__(self, typed: Optional[bool] = None):
+        """
+        Initialize the trading bot
+        
+        Args:
+            typed: Return typed records (Order, Position, Balance) instead of
+                   raw response dicts. Defaults to Config.TYPED_RECORDS
+        """
         logger.info("=" * 60)
         logger.info("Initializing Binance Futures Trading Bot")
         logger.info("=" * 60)
@@ -26,8 +33,10 @@ class TradingBot:
             self.client = Client(Config.API_KEY, Config.API_SECRET)
             logger.info("Bot initialized in LIVE mode")
         
+        self.typed = Config.TYPED_RECORDS if typed is None else typed
+        
         # Initialize order manager
-        self.order_manager = OrderManager(self.client)
+        self.order_manager = OrderManager(self.client, typed=self.typed)
         
         # Validate connection
         self._validate_connection()
@@ -52,17 +61,19 @@ class TradingBot:
             raise
     
     # Account Information Methods
-    def get_account_balance(self) -> List[Dict[str, Any]]:
+    def get_account_balance(self) -> List[Union[Balance, Dict[str, Any]]]:
         """Get account balance information"""
         try:
             balance = self.client.futures_account_balance()
             logger.debug(f"Retrieved account balance")
+            if self.typed:
+                return [Balance.from_dict(b) for b in balance]
             return balance
         except BinanceAPIException as e:
             logger.error(f"Error fetching balance: {e}")
             raise
     
-    def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_positions(self, symbol: Optional[str] = None) -> List[Union[Position, Dict[str, Any]]]:
         """Get position information"""
         try:
             if symbol:
@@ -70,6 +81,8 @@ class TradingBot:
             
             positions = self.client.futures_position_information(symbol=symbol)
             logger.debug(f"Retrieved position information")
+            if self.typed:
+                return [Position.from_dict(p) for p in positions]
             return positions
             
         except BinanceAPIException as e:
@@ -143,30 +156,45 @@ class TradingBot:
             raise
     
     # Order Methods (delegated to OrderManager)
-    def place_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
+    def place_market_order(self, symbol: str, side: str, quantity: float) -> Union[Order, Dict[str, Any]]:
         """Place a market order"""
         return self.order_manager.place_market_order(symbol, side, quantity)
     
     def place_limit_order(self, symbol: str, side: str, quantity: float, 
-                         price: float) -> Dict[str, Any]:
+                         price: float) -> Union[Order, Dict[str, Any]]:
         """Place a limit order"""
         return self.order_manager.place_limit_order(symbol, side, quantity, price)
     
     def place_stop_limit_order(self, symbol: str, side: str, quantity: float,
-                              stop_price: float, limit_price: float) -> Dict[str, Any]:
+                              stop_price: float, limit_price: float) -> Union[Order, Dict[str, Any]]:
         """Place a stop-limit order"""
         return self.order_manager.place_stop_limit_order(
             symbol, side, quantity, stop_price, limit_price
         )
     
-    def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[Union[Order, Dict[str, Any]]]:
         """Get open orders"""
         return self.order_manager.get_open_orders(symbol)
     
-    def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    def cancel_order(self, symbol: str, order_id: int) -> Union[Order, Dict[str, Any]]:
         """Cancel an order"""
         return self.order_manager.cancel_order(symbol, order_id)
     
-    def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    def get_order_status(self, symbol: str, order_id: int) -> Union[Order, Dict[str, Any]]:
         """Get order status"""
-        return self.order_manager.get_order_status(symbol, order_id)
\ No newline at end of file
+        return self.order_manager.get_order_status(symbol, order_id)
+    
+    def modify_order(self, symbol: str, order_id: int, price: float,
+                     quantity: Optional[float] = None) -> Union[Order, Dict[str, Any]]:
+        """Modify a resting limit order in place"""
+        return self.order_manager.modify_order(symbol, order_id, price, quantity)
+    
+    def modify_orders(self, symbol: str,
+                      amendments: List[Dict[str, Any]]) -> List[Union[Order, Dict[str, Any]]]:
+        """Modify several resting limit orders in one batch request"""
+        return self.order_manager.modify_orders(symbol, amendments)
+    
+    def cancel_replace(self, symbol: str, order_id: int, side: str, quantity: float,
+                       price: float) -> Union[Order, Dict[str, Any]]:
+        """Replace a resting limit order, amending in place when possible"""
+        return self.order_manager.cancel_replace(symbol, order_id, side, quantity, price)
\ No newline at end of file
@@ -0,0 +1,167 @@
+from decimal import Decimal
+from typing import Dict, Any
+
+
+class _Field:
+    """Lazily parsed record field backed by a private slot"""
+
+    def __init__(self, key: str, parser=None):
+        self.key = key
+        self.parser = parser
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        value = getattr(obj, self.slot)
+        if self.parser is not None and isinstance(value, str):
+            # Parse once, then keep the parsed value in place of the string
+            value = self.parser(value) if value != '' else None
+            setattr(obj, self.slot, value)
+        return value
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+class _Record:
+    """
+    Base class for compact typed records built from API response dicts
+
+    Only the declared fields are kept. Numeric string fields stay as the raw
+    strings until first access and are then parsed once into Decimal/int.
+    Values the JSON decoder already typed (ints, bools) are stored as-is.
+    """
+
+    __slots__ = ()
+    _fields: Dict[str, _Field] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = {
+            name: attr for name, attr in vars(cls).items()
+            if isinstance(attr, _Field)
+        }
+
+        slots = cls.__dict__.get('__slots__', ())
+        missing = [f.slot for f in cls._fields.values() if f.slot not in slots]
+        if missing:
+            raise TypeError(f"{cls.__name__} is missing __slots__ for: {', '.join(missing)}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """
+        Build a record from a raw response dictionary
+
+        Args:
+            data: Response dictionary from python-binance
+
+        Returns:
+            Record instance
+        """
+        record = cls.__new__(cls)
+        for field in cls._fields.values():
+            value = data.get(field.key)
+            if isinstance(value, float) and field.parser is Decimal:
+                # Only floats need converting; JSON ints/bools are kept as-is
+                value = Decimal(str(value))
+            setattr(record, field.slot, value)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the parsed fields as a plain dictionary"""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    # Records are mutable (lazy parsing rewrites their slots), so they are
+    # deliberately unhashable; key journals by order_id/trade_id instead
+    __hash__ = None
+
+
+class Order(_Record):
+    """Futures order as returned by create/get/cancel order endpoints"""
+
+    __slots__ = ('_order_id', '_client_order_id', '_symbol', '_side', '_type',
+                 '_status', '_time_in_force', '_price', '_stop_price',
+                 '_avg_price', '_orig_qty', '_executed_qty', '_update_time')
+
+    order_id = _Field('orderId', int)
+    client_order_id = _Field('clientOrderId')
+    symbol = _Field('symbol')
+    side = _Field('side')
+    type = _Field('type')
+    status = _Field('status')
+    time_in_force = _Field('timeInForce')
+    price = _Field('price', Decimal)
+    stop_price = _Field('stopPrice', Decimal)
+    avg_price = _Field('avgPrice', Decimal)
+    orig_qty = _Field('origQty', Decimal)
+    executed_qty = _Field('executedQty', Decimal)
+    update_time = _Field('updateTime', int)
+
+
+class Fill(_Record):
+    """Single trade execution from the account trade list"""
+
+    __slots__ = ('_trade_id', '_order_id', '_symbol', '_side', '_price', '_qty',
+                 '_quote_qty', '_commission', '_commission_asset',
+                 '_realized_pnl', '_maker', '_time')
+
+    trade_id = _Field('id', int)
+    order_id = _Field('orderId', int)
+    symbol = _Field('symbol')
+    side = _Field('side')
+    price = _Field('price', Decimal)
+    qty = _Field('qty', Decimal)
+    quote_qty = _Field('quoteQty', Decimal)
+    commission = _Field('commission', Decimal)
+    commission_asset = _Field('commissionAsset')
+    realized_pnl = _Field('realizedPnl', Decimal)
+    maker = _Field('maker', _to_bool)
+    time = _Field('time', int)
+
+
+class Position(_Record):
+    """Futures position from the position information endpoint"""
+
+    __slots__ = ('_symbol', '_position_side', '_position_amt', '_entry_price',
+                 '_mark_price', '_unrealized_profit', '_liquidation_price')
+
+    symbol = _Field('symbol')
+    position_side = _Field('positionSide')
+    position_amt = _Field('positionAmt', Decimal)
+    entry_price = _Field('entryPrice', Decimal)
+    mark_price = _Field('markPrice', Decimal)
+    unrealized_profit = _Field('unRealizedProfit', Decimal)
+    liquidation_price = _Field('liquidationPrice', Decimal)
+
+    @property
+    def is_open(self) -> bool:
+        """True if the position has a non-zero amount"""
+        return bool(self.position_amt)
+
+
+class Balance(_Record):
+    """Asset balance from the futures account balance endpoint"""
+
+    __slots__ = ('_asset', '_balance', '_available_balance',
+                 '_cross_wallet_balance', '_cross_un_pnl')
+
+    asset = _Field('asset')
+    balance = _Field('balance', Decimal)
+    available_balance = _Field('availableBalance', Decimal)
+    cross_wallet_balance = _Field('crossWalletBalance', Decimal)
+    cross_un_pnl = _Field('crossUnPnl', Decimal)
@@ -1,5 +1,10 @@
-from typing import Dict, Any, Optional, List
+import json
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Dict, Any, Optional, List, Union
 from binance.exceptions import BinanceAPIException
+from config import Config
+from src.models import Order
 from logs.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -8,10 +13,54 @@ logger = setup_logger(__name__)
 class OrderManager:
     """Handles all order-related operations"""
     
-    def __init__(self, client):
+    OPEN_STATUSES = ('NEW', 'PARTIALLY_FILLED')
+    MAX_BATCH_SIZE = 5
+    MAX_CACHED_ORDERS = 1000
+    
+    def __init__(self, client, typed: Optional[bool] = None):
         self.client = client
+        self.typed = Config.TYPED_RECORDS if typed is None else typed
+        # Resting orders seen by this manager, keyed by order ID (oldest first)
+        self.order_cache: 'OrderedDict[int, Order]' = OrderedDict()
         logger.info("OrderManager initialized")
     
+    def _to_order(self, order: Dict[str, Any],
+                  record: Optional[Order] = None) -> Union[Order, Dict[str, Any]]:
+        """Wrap a raw order response in an Order record if typed mode is on"""
+        if not self.typed:
+            return order
+        return record if record is not None else Order.from_dict(order)
+    
+    def _cache_order(self, order: Dict[str, Any]) -> Optional[Order]:
+        """
+        Track an order while it rests in the book, drop it once it is done
+        
+        Returns:
+            The cached Order record, or None if the order is not cached
+        """
+        order_id = order.get('orderId')
+        if order.get('type') == 'MARKET' or order.get('status') not in self.OPEN_STATUSES:
+            self.order_cache.pop(order_id, None)
+            return None
+        
+        record = Order.from_dict(order)
+        self.order_cache[order_id] = record
+        self.order_cache.move_to_end(order_id)
+        while len(self.order_cache) > self.MAX_CACHED_ORDERS:
+            self.order_cache.popitem(last=False)
+        return record
+    
+    def _track_order(self, order: Dict[str, Any]) -> Union[Order, Dict[str, Any]]:
+        """Cache an order response and return it, building the record only once"""
+        return self._to_order(order, self._cache_order(order))
+    
+    @staticmethod
+    def _format_number(value) -> str:
+        """Format a price/quantity as a plain decimal string (no exponent)"""
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return format(value, 'f')
+    
     def _validate_params(self, symbol: str, side: str, quantity: float):
         """Validate basic order parameters"""
         if not symbol:
@@ -23,7 +72,7 @@ class OrderManager:
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
     
-    def place_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
+    def place_market_order(self, symbol: str, side: str, quantity: float) -> Union[Order, Dict[str, Any]]:
         """
         Place a market order
         
@@ -52,7 +101,7 @@ class OrderManager:
             logger.info(f"✓ Market order executed - Order ID: {order['orderId']}")
             logger.debug(f"Order details: {order}")
             
-            return order
+            return self._track_order(order)
             
         except BinanceAPIException as e:
             logger.error(f"✗ Market order failed: {e}")
@@ -62,7 +111,7 @@ class OrderManager:
             raise
     
     def place_limit_order(self, symbol: str, side: str, quantity: float, 
-                         price: float, time_in_force: str = 'GTC') -> Dict[str, Any]:
+                         price: float, time_in_force: str = 'GTC') -> Union[Order, Dict[str, Any]]:
         """
         Place a limit order
         
@@ -98,7 +147,7 @@ class OrderManager:
             logger.info(f"✓ Limit order placed - Order ID: {order['orderId']}")
             logger.debug(f"Order details: {order}")
             
-            return order
+            return self._track_order(order)
             
         except BinanceAPIException as e:
             logger.error(f"✗ Limit order failed: {e}")
@@ -109,7 +158,7 @@ class OrderManager:
     
     def place_stop_limit_order(self, symbol: str, side: str, quantity: float,
                               stop_price: float, limit_price: float,
-                              time_in_force: str = 'GTC') -> Dict[str, Any]:
+                              time_in_force: str = 'GTC') -> Union[Order, Dict[str, Any]]:
         """
         Place a stop-limit order
         
@@ -148,7 +197,7 @@ class OrderManager:
             logger.info(f"✓ Stop-limit order placed - Order ID: {order['orderId']}")
             logger.debug(f"Order details: {order}")
             
-            return order
+            return self._track_order(order)
             
         except BinanceAPIException as e:
             logger.error(f"✗ Stop-limit order failed: {e}")
@@ -157,7 +206,7 @@ class OrderManager:
             logger.error(f"✗ Unexpected error: {e}")
             raise
     
-    def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[Union[Order, Dict[str, Any]]]:
         """
         Get all open orders
         
@@ -174,13 +223,17 @@ class OrderManager:
             orders = self.client.futures_get_open_orders(symbol=symbol)
             logger.info(f"Retrieved {len(orders)} open order(s)")
             
-            return orders
+            # Replace cached orders for the queried symbol(s) with the fresh list
+            for order_id, cached in list(self.order_cache.items()):
+                if symbol is None or cached.symbol == symbol:
+                    del self.order_cache[order_id]
+            return [self._track_order(o) for o in orders]
             
         except BinanceAPIException as e:
             logger.error(f"Failed to get open orders: {e}")
             raise
     
-    def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    def cancel_order(self, symbol: str, order_id: int) -> Union[Order, Dict[str, Any]]:
         """
         Cancel an open order
         
@@ -201,13 +254,15 @@ class OrderManager:
             )
             
             logger.info(f"✓ Order {order_id} cancelled")
-            return result
+            self.order_cache.pop(order_id, None)
+            return self._to_order(result)
             
         except BinanceAPIException as e:
             logger.error(f"✗ Cancel order failed: {e}")
+            self.order_cache.pop(order_id, None)
             raise
     
-    def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    def get_order_status(self, symbol: str, order_id: int) -> Union[Order, Dict[str, Any]]:
         """
         Get status of a specific order
         
@@ -226,8 +281,180 @@ class OrderManager:
             )
             
             logger.info(f"Order {order_id} status: {order['status']}")
-            return order
+            return self._track_order(order)
             
         except BinanceAPIException as e:
             logger.error(f"Failed to get order status: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def _get_resting_order(self, symbol: str, order_id: int) -> Order:
+        """Return a resting order from the cache, fetching it only on a miss"""
+        order = self.order_cache.get(order_id)
+        if order is None:
+            raw = self.client.futures_get_order(symbol=symbol, orderId=order_id)
+            order = self._cache_order(raw) or Order.from_dict(raw)
+        
+        if order.symbol != symbol:
+            raise ValueError(f"Order {order_id} belongs to {order.symbol}, not {symbol}")
+        if order.status not in self.OPEN_STATUSES:
+            raise ValueError(f"Order {order_id} is {order.status} and cannot be modified")
+        
+        return order
+    
+    def _build_amendment(self, order: Order, price: float,
+                         quantity: Optional[float] = None) -> Dict[str, Any]:
+        """Validate an amendment locally and return the modify-order parameters"""
+        if price <= 0:
+            raise ValueError("Price must be positive")
+        
+        if order.type != 'LIMIT':
+            raise ValueError("Only LIMIT orders can be modified")
+        
+        if quantity is None:
+            quantity = order.orig_qty
+        elif quantity <= 0:
+            raise ValueError("Quantity must be positive")
+        
+        return {
+            'symbol': order.symbol,
+            'orderId': order.order_id,
+            'side': order.side,
+            'quantity': self._format_number(quantity),
+            'price': self._format_number(price),
+        }
+    
+    def modify_order(self, symbol: str, order_id: int, price: float,
+                     quantity: Optional[float] = None) -> Union[Order, Dict[str, Any]]:
+        """
+        Modify the price (and optionally the quantity) of a resting limit order
+        
+        Uses a single modify-order request instead of a cancel followed by a
+        new order, so the order never leaves the book.
+        
+        Args:
+            symbol: Trading pair
+            order_id: Order ID to modify
+            price: New limit price (required)
+            quantity: New quantity (keeps the current quantity if omitted)
+            
+        Returns:
+            Modified order response
+        """
+        symbol = symbol.upper()
+        
+        try:
+            params = self._build_amendment(self._get_resting_order(symbol, order_id),
+                                           price, quantity)
+            logger.info(f"Modifying order {order_id}: {params['quantity']} {symbol} @ ${params['price']}")
+            
+            order = self.client.futures_modify_order(**params)
+            
+            logger.info(f"✓ Order {order_id} modified")
+            logger.debug(f"Order details: {order}")
+            
+            return self._track_order(order)
+            
+        except BinanceAPIException as e:
+            logger.error(f"✗ Modify order failed: {e}")
+            self.order_cache.pop(order_id, None)
+            raise
+    
+    def modify_orders(self, symbol: str,
+                      amendments: List[Dict[str, Any]]) -> List[Union[Order, Dict[str, Any]]]:
+        """
+        Modify several resting limit orders using the batch modify endpoint
+        
+        Orders missing from the cache are looked up with a single open-orders
+        request for the symbol rather than one request per order.
+        
+        Each batch request is independent: if one fails, the remaining
+        batches are still sent and every amendment in the failed batch is
+        reported as an error entry instead of raising, so callers can always
+        see which orders moved.
+        
+        Args:
+            symbol: Trading pair
+            amendments: List of dicts with 'order_id', 'price' and optionally
+                        'quantity'
+            
+        Returns:
+            One entry per amendment, in order. Rejected amendments (and all
+            amendments of a failed batch request) are returned as an error
+            dictionary ({'code': ..., 'msg': ...})
+        """
+        symbol = symbol.upper()
+        
+        if any(a['order_id'] not in self.order_cache for a in amendments):
+            self.get_open_orders(symbol)
+        
+        batch = []
+        for a in amendments:
+            order = self.order_cache.get(a['order_id'])
+            if order is None or order.symbol != symbol:
+                raise ValueError(f"Order {a['order_id']} is not an open {symbol} order")
+            batch.append(self._build_amendment(order, a['price'], a.get('quantity')))
+        
+        results = []
+        for start in range(0, len(batch), self.MAX_BATCH_SIZE):
+            chunk = batch[start:start + self.MAX_BATCH_SIZE]
+            logger.info(f"Modifying {len(chunk)} order(s) for {symbol} in one batch")
+            
+            try:
+                response = self.client.futures_v1_put_batch_orders(
+                    batchOrders=json.dumps(chunk, separators=(',', ':'))
+                )
+            except BinanceAPIException as e:
+                logger.error(f"✗ Batch modify failed: {e}")
+                response = [{'code': e.code, 'msg': e.message} for _ in chunk]
+            
+            for params, order in zip(chunk, response):
+                if 'code' in order:
+                    logger.error(f"✗ Modify order {params['orderId']} failed: {order['msg']}")
+                    self.order_cache.pop(params['orderId'], None)
+                    results.append(order)
+                else:
+                    results.append(self._track_order(order))
+        
+        failed = sum(1 for r in results if isinstance(r, dict) and 'code' in r)
+        logger.info(f"✓ Batch modify finished: {len(batch) - failed} modified, {failed} failed")
+        return results
+    
+    def cancel_replace(self, symbol: str, order_id: int, side: str, quantity: float,
+                       price: float, time_in_force: str = 'GTC') -> Union[Order, Dict[str, Any]]:
+        """
+        Replace a resting limit order with a new one
+        
+        When only price and/or quantity change this is done with a single
+        modify-order request. If the side or time in force changes, the
+        order is cancelled and a new limit order is placed. Only LIMIT
+        orders can be replaced.
+        
+        Args:
+            symbol: Trading pair
+            order_id: Order ID to replace
+            side: 'BUY' or 'SELL'
+            quantity: New quantity
+            price: New limit price
+            time_in_force: Time in force (GTC, IOC, FOK)
+            
+        Returns:
+            Modified or newly placed order response
+        """
+        symbol = symbol.upper()
+        side = side.upper()
+        time_in_force = time_in_force.upper()
+        self._validate_params(symbol, side, quantity)
+        
+        if price <= 0:
+            raise ValueError("Price must be positive")
+        
+        order = self._get_resting_order(symbol, order_id)
+        if order.type != 'LIMIT':
+            raise ValueError(f"Order {order_id} is a {order.type} order; only LIMIT orders can be replaced")
+        
+        if order.side == side and order.time_in_force == time_in_force:
+            return self.modify_order(symbol, order_id, price, quantity)
+        
+        logger.info(f"Order {order_id} cannot be amended in place, cancelling and replacing")
+        self.cancel_order(symbol, order_id)
+        return self.place_limit_order(symbol, side, quantity, price, time_in_force)
@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+import pytest
+
+from src.models import Order, Fill, Position, Balance, _Field, _Record
+
+
+def test_from_dict_keeps_declared_fields_only():
+    order = Order.from_dict({'orderId': 42, 'symbol': 'BTCUSDT', 'extra': 'x'})
+
+    assert order.order_id == 42
+    assert order.symbol == 'BTCUSDT'
+    assert not hasattr(order, '__dict__')
+    assert 'extra' not in order.to_dict()
+
+
+def test_numeric_strings_are_parsed_once_and_replaced():
+    order = Order.from_dict({'price': '100.10', 'origQty': '0.001'})
+
+    price = order.price
+    assert isinstance(price, Decimal)
+    assert price == Decimal('100.10')
+    assert order.price is price
+    assert order.orig_qty == Decimal('0.001')
+
+
+def test_empty_and_missing_values_become_none():
+    position = Position.from_dict({'positionAmt': '0', 'entryPrice': ''})
+
+    assert position.entry_price is None
+    assert position.mark_price is None
+    assert position.is_open is False
+
+
+def test_json_typed_values_are_kept_as_is():
+    fill = Fill.from_dict({'id': 7, 'maker': True, 'time': 1700000000000, 'price': 1.5})
+
+    assert fill.trade_id == 7
+    assert fill.maker is True
+    assert fill.time == 1700000000000
+    assert fill.price == Decimal('1.5')
+
+
+def test_string_bools_are_parsed():
+    assert Fill.from_dict({'maker': 'false'}).maker is False
+
+
+def test_to_dict_and_equality():
+    data = {'asset': 'USDT', 'balance': '10.5', 'availableBalance': '8'}
+    balance = Balance.from_dict(data)
+
+    assert balance.to_dict() == {
+        'asset': 'USDT',
+        'balance': Decimal('10.5'),
+        'available_balance': Decimal('8'),
+        'cross_wallet_balance': None,
+        'cross_un_pnl': None,
+    }
+    assert balance == Balance.from_dict(data)
+    assert balance != Balance.from_dict({'asset': 'BTC'})
+
+
+def test_records_are_unhashable():
+    with pytest.raises(TypeError):
+        hash(Order.from_dict({'orderId': 1}))
+
+
+def test_missing_slot_fails_at_class_definition():
+    with pytest.raises(TypeError, match='_qty'):
+        class Broken(_Record):
+            __slots__ = ('_price',)
+
+            price = _Field('price', Decimal)
+            qty = _Field('qty', Decimal)
@@ -0,0 +1,195 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip('binance')
+
+from binance.exceptions import BinanceAPIException
+from src.models import Order
+from src.orders import OrderManager
+
+
+def make_order(order_id, **overrides):
+    order = {
+        'orderId': order_id,
+        'symbol': 'BTCUSDT',
+        'side': 'BUY',
+        'type': 'LIMIT',
+        'status': 'NEW',
+        'timeInForce': 'GTC',
+        'price': '100',
+        'origQty': '0.010',
+    }
+    order.update(overrides)
+    return order
+
+
+def echo_batch(batchOrders):
+    return [make_order(a['orderId'], price=a['price'], origQty=a['quantity'])
+            for a in json.loads(batchOrders)]
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.futures_modify_order.side_effect = lambda **p: make_order(
+        p['orderId'], price=p['price'], origQty=p['quantity'])
+    return client
+
+
+@pytest.fixture
+def manager(client):
+    return OrderManager(client, typed=False)
+
+
+def test_modify_order_sends_plain_decimal_strings(manager, client):
+    manager._cache_order(make_order(1))
+
+    manager.modify_order('btcusdt', 1, 0.00001, 0.00002)
+
+    client.futures_modify_order.assert_called_once_with(
+        symbol='BTCUSDT', orderId=1, side='BUY', quantity='0.00002', price='0.00001')
+
+
+def test_modify_order_keeps_cached_quantity(manager, client):
+    manager._cache_order(make_order(1))
+
+    manager.modify_order('BTCUSDT', 1, 101)
+
+    assert client.futures_modify_order.call_args.kwargs['quantity'] == '0.010'
+    client.futures_get_order.assert_not_called()
+
+
+def test_modify_order_fetches_once_on_cache_miss(manager, client):
+    client.futures_get_order.return_value = make_order(1)
+
+    manager.modify_order('BTCUSDT', 1, 101)
+
+    client.futures_get_order.assert_called_once_with(symbol='BTCUSDT', orderId=1)
+    assert 1 in manager.order_cache
+
+
+def test_modify_order_evicts_on_api_error(manager, client):
+    manager._cache_order(make_order(1))
+    client.futures_modify_order.side_effect = BinanceAPIException(
+        MagicMock(), 400, '{"code": -2013, "msg": "Order does not exist."}')
+
+    with pytest.raises(BinanceAPIException):
+        manager.modify_order('BTCUSDT', 1, 101)
+
+    assert 1 not in manager.order_cache
+
+
+@pytest.mark.parametrize('order, symbol', [
+    (make_order(1, type='STOP'), 'BTCUSDT'),
+    (make_order(1, status='FILLED'), 'BTCUSDT'),
+    (make_order(1), 'ETHUSDT'),
+])
+def test_modify_order_rejects_invalid_orders(manager, client, order, symbol):
+    client.futures_get_order.return_value = order
+
+    with pytest.raises(ValueError):
+        manager.modify_order(symbol, 1, 101)
+
+    client.futures_modify_order.assert_not_called()
+
+
+def test_modify_orders_splits_batches_and_reports_rejections(manager, client):
+    client.futures_get_open_orders.return_value = [make_order(i) for i in range(1, 8)]
+
+    def batch(batchOrders):
+        response = echo_batch(batchOrders)
+        response[0] = {'code': -2013, 'msg': 'Order does not exist.'}
+        return response
+
+    client.futures_v1_put_batch_orders.side_effect = batch
+
+    results = manager.modify_orders('BTCUSDT', [
+        {'order_id': i, 'price': 101} for i in range(1, 8)
+    ])
+
+    client.futures_get_open_orders.assert_called_once_with(symbol='BTCUSDT')
+    sizes = [len(json.loads(c.kwargs['batchOrders']))
+             for c in client.futures_v1_put_batch_orders.call_args_list]
+    assert sizes == [5, 2]
+    assert results[0] == {'code': -2013, 'msg': 'Order does not exist.'}
+    assert results[5] == {'code': -2013, 'msg': 'Order does not exist.'}
+    assert results[1]['price'] == '101'
+    assert 1 not in manager.order_cache and 6 not in manager.order_cache
+    assert 2 in manager.order_cache
+
+
+def test_modify_orders_returns_partial_results_when_a_batch_fails(manager, client):
+    for i in range(1, 8):
+        manager._cache_order(make_order(i))
+    calls = []
+
+    def batch(batchOrders):
+        calls.append(batchOrders)
+        if len(calls) == 2:
+            raise BinanceAPIException(
+                MagicMock(), 429, '{"code": -1003, "msg": "Too many requests."}')
+        return echo_batch(batchOrders)
+
+    client.futures_v1_put_batch_orders.side_effect = batch
+
+    results = manager.modify_orders('BTCUSDT', [
+        {'order_id': i, 'price': 101} for i in range(1, 8)
+    ])
+
+    assert [r['orderId'] for r in results[:5]] == [1, 2, 3, 4, 5]
+    assert results[5:] == [{'code': -1003, 'msg': 'Too many requests.'}] * 2
+    assert 6 not in manager.order_cache and 7 not in manager.order_cache
+
+
+def test_cancel_replace_modifies_in_place_when_side_and_tif_match(manager, client):
+    manager._cache_order(make_order(1))
+
+    manager.cancel_replace('BTCUSDT', 1, 'buy', 0.02, 101, 'gtc')
+
+    client.futures_modify_order.assert_called_once()
+    client.futures_cancel_order.assert_not_called()
+    client.futures_create_order.assert_not_called()
+
+
+@pytest.mark.parametrize('side, time_in_force', [('SELL', 'GTC'), ('BUY', 'IOC')])
+def test_cancel_replace_falls_back_to_cancel_and_place(manager, client, side, time_in_force):
+    manager._cache_order(make_order(1))
+    client.futures_cancel_order.return_value = make_order(1, status='CANCELED')
+    client.futures_create_order.return_value = make_order(2, side=side)
+
+    manager.cancel_replace('BTCUSDT', 1, side, 0.02, 101, time_in_force)
+
+    client.futures_modify_order.assert_not_called()
+    client.futures_cancel_order.assert_called_once_with(symbol='BTCUSDT', orderId=1)
+    client.futures_create_order.assert_called_once()
+    assert 1 not in manager.order_cache
+
+
+def test_cancel_replace_rejects_non_limit_orders(manager, client):
+    manager._cache_order(make_order(1, type='STOP'))
+
+    with pytest.raises(ValueError):
+        manager.cancel_replace('BTCUSDT', 1, 'BUY', 0.01, 101)
+
+    client.futures_cancel_order.assert_not_called()
+
+
+def test_cache_skips_market_orders_and_evicts_oldest(manager):
+    manager.MAX_CACHED_ORDERS = 3
+    manager._cache_order(make_order(99, type='MARKET'))
+    for i in range(1, 6):
+        manager._cache_order(make_order(i))
+
+    assert list(manager.order_cache) == [3, 4, 5]
+
+
+def test_typed_mode_returns_the_cached_record(client):
+    manager = OrderManager(client, typed=True)
+    client.futures_create_order.return_value = make_order(1)
+
+    order = manager.place_limit_order('BTCUSDT', 'BUY', 0.01, 100)
+
+    assert isinstance(order, Order)
+    assert manager.order_cache[1] is order